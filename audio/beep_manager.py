@@ -21,12 +21,17 @@ class BeepManager:
         """Get full path to wav file in controller directory."""
         return os.path.join(self.wav_dir, filename)
 
-    def _play_beep(self, filename: str = "activation.wav"):
-        wav_path = self._get_wav_path(filename)
-        data, samplerate = sf.read(wav_path, dtype='float32')
+    def load_wav(self, filename: str):
+        """Read a wav file from the controller/wav directory as (data, samplerate)."""
+        return sf.read(self._get_wav_path(filename), dtype='float32')
+
+    def _play_buffer(self, data, samplerate: int):
         sd.play(data, samplerate)
         sd.wait()
 
+    def _play_beep(self, filename: str = "activation.wav"):
+        self._play_buffer(*self.load_wav(filename))
+
     def play_beep(self, filename: str = "activation.wav"):
         """
         Play a beep sound in a non-blocking way.
@@ -35,3 +40,13 @@ class BeepManager:
             filename: Name of wav file in controller/wav directory
         """
         threading.Thread(target=self._play_beep, args=(filename,), daemon=True).start()
+
+    def play_buffer(self, data, samplerate: int):
+        """
+        Play an in-memory audio buffer in a non-blocking way.
+
+        Args:
+            data: Audio samples as returned by load_wav
+            samplerate: Sample rate of the buffer in Hz
+        """
+        threading.Thread(target=self._play_buffer, args=(data, samplerate), daemon=True).start()
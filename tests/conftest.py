@@ -118,5 +118,6 @@ def sample_audio_with_speech():
 def patch_config(mock_config):
     """Patch the config loading for modules that load config at import."""
     with patch("builtins.open", MagicMock()):
-        with patch("yaml.safe_load", return_value=mock_config):
+        with patch("yaml.safe_load", return_value=mock_config), \
+                patch("yaml.load", return_value=mock_config):
             yield mock_config
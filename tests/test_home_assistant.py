@@ -0,0 +1,102 @@
+"""
+Tests for the Home Assistant tool module.
+"""
+
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def _response(status_code=200, json_data=None):
+    """Build a fake requests response."""
+    response = MagicMock(status_code=status_code)
+    response.json.return_value = json_data
+    return response
+
+
+@pytest.fixture
+def ha(patch_config, monkeypatch):
+    """Import the Home Assistant module with a configured token and fresh bulk state."""
+    import tools.home_assistant as ha
+    monkeypatch.setattr(ha, "_HA_READY", True)
+    monkeypatch.setattr(ha, "_bulk_states_supported", None)
+    return ha
+
+
+class TestGetStates:
+    """Tests for multi-entity state fetching."""
+
+    def test_filters_unrequested_states(self, ha, monkeypatch):
+        """Instances that ignore filter_entity_id return every state."""
+        every_state = [
+            {"entity_id": "light.kitchen", "state": "on"},
+            {"entity_id": "switch.fan", "state": "off"},
+            {"entity_id": "lock.front_door", "state": "locked"},
+        ]
+        get = MagicMock(return_value=_response(json_data=every_state))
+        monkeypatch.setattr(ha._session, "get", get)
+
+        states = ha._get_states(["light.kitchen", "switch.fan"])
+
+        assert set(states) == {"light.kitchen", "switch.fan"}
+        assert states["switch.fan"]["state"] == "off"
+        assert get.call_count == 1
+        assert ha._bulk_states_supported is True
+
+    def test_falls_back_per_entity_on_404(self, ha, monkeypatch):
+        def fake_get(url, **kwargs):
+            if url.endswith("/api/states"):
+                return _response(status_code=404)
+            entity_id = url.rsplit("/", 1)[1]
+            return _response(json_data={"entity_id": entity_id, "state": "on"})
+
+        get = MagicMock(side_effect=fake_get)
+        monkeypatch.setattr(ha._session, "get", get)
+
+        states = ha._get_states(["light.kitchen", "switch.fan"])
+
+        assert set(states) == {"light.kitchen", "switch.fan"}
+        urls = [c.args[0] for c in get.call_args_list]
+        assert urls == [
+            f"{ha.HA_URL}/api/states",
+            f"{ha.HA_URL}/api/states/light.kitchen",
+            f"{ha.HA_URL}/api/states/switch.fan",
+        ]
+        assert ha._bulk_states_supported is False
+
+    def test_skips_bulk_request_after_404(self, ha, monkeypatch):
+        monkeypatch.setattr(ha, "_bulk_states_supported", False)
+        get = MagicMock(return_value=_response(json_data={"entity_id": "light.kitchen", "state": "on"}))
+        monkeypatch.setattr(ha._session, "get", get)
+
+        states = ha._get_states(["light.kitchen"])
+
+        assert list(states) == ["light.kitchen"]
+        urls = [c.args[0] for c in get.call_args_list]
+        assert urls == [f"{ha.HA_URL}/api/states/light.kitchen"]
+
+
+class TestBulkStatus:
+    """Tests for the multi-entity status tools."""
+
+    @pytest.mark.parametrize("entities", ["", " , ", []])
+    def test_bulk_status_requires_an_entity(self, ha, monkeypatch, entities):
+        get = MagicMock()
+        monkeypatch.setattr(ha._session, "get", get)
+
+        assert ha.ha_get_bulk_status(entities) == "Error: No entity specified"
+        get.assert_not_called()
+
+    def test_repeated_entities_reported_once(self, ha, monkeypatch):
+        states = {"light.kitchen": {"entity_id": "light.kitchen", "state": "on", "attributes": {}}}
+        monkeypatch.setattr(ha, "_get_states", lambda ids: {i: states[i] for i in ids if i in states})
+        monkeypatch.setattr(ha, "_get_services", lambda: {"light": ["turn_on"]})
+
+        assert ha.get_entity_state("light.kitchen, light.kitchen") == "light.kitchen is on"
+        assert ha.ha_get_bulk_status(["light.kitchen", "light.kitchen"]) == (
+            "light.kitchen is on (services: turn_on)"
+        )
@@ -0,0 +1,209 @@
+"""
+Tests for the weather and time tool module.
+"""
+
+import pytest
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import tools.weather_time as weather_time
+from tools.weather_time import parse_duration
+
+
+def _area_xml(name, *periods):
+    """Build an <area> element; each period is (start-time-local or None, precis or None)."""
+    chunks = []
+    for start, precis in periods:
+        start_attr = f' start-time-local="{start}"' if start else ""
+        precis_el = f'<text type="precis">{precis}</text>' if precis else '<text type="precis"/>'
+        chunks.append(
+            f'<forecast-period{start_attr}>'
+            '<element type="air_temperature_maximum">24</element>'
+            f'{precis_el}</forecast-period>'
+        )
+    return f'<area description="{name}" type="location">{"".join(chunks)}</area>'
+
+
+def _forecast_xml(*areas):
+    return f'<?xml version="1.0"?><product><forecast>{"".join(areas)}</forecast></product>'.encode()
+
+
+def _day(offset=0):
+    return f"{date.today() + timedelta(days=offset):%Y-%m-%d}T05:00:00+11:00"
+
+
+class FakeFTP:
+    """Anonymous FTP stand-in that serves DATA in small blocks and counts connections."""
+
+    DATA = b""
+    connections = 0
+
+    def __init__(self, host):
+        FakeFTP.connections += 1
+
+    def login(self):
+        pass
+
+    def retrbinary(self, cmd, callback):
+        for i in range(0, len(self.DATA), 64):
+            callback(self.DATA[i:i + 64])
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestParseDuration:
+    """Tests for spoken timer duration parsing."""
+
+    def test_number_word_minutes(self):
+        assert parse_duration("ten minutes") == 600
+
+    def test_digit_hours(self):
+        assert parse_duration("2 hours") == 7200
+
+    def test_attached_unit(self):
+        assert parse_duration("10min") == 600
+
+    def test_compound_number_words(self):
+        assert parse_duration("twenty five seconds") == 25
+
+    def test_hyphenated_number_words(self):
+        assert parse_duration("twenty-five seconds") == 25
+
+    def test_hundred(self):
+        assert parse_duration("one hundred and twenty minutes") == 7200
+
+    def test_multiple_units(self):
+        assert parse_duration("one hour and thirty minutes") == 5400
+
+    def test_decimal_hours(self):
+        assert parse_duration("1.5 hours") == 5400
+
+    def test_separate_digits_are_not_added(self):
+        assert parse_duration("1 5 minutes") == 300
+
+    def test_an_hour(self):
+        assert parse_duration("an hour") == 3600
+
+    def test_half_an_hour(self):
+        assert parse_duration("half an hour") == 1800
+
+    def test_quarter_of_an_hour(self):
+        assert parse_duration("quarter of an hour") == 900
+
+    def test_three_quarters_of_an_hour(self):
+        assert parse_duration("three quarters of an hour") == 2700
+
+    def test_half_a_minute(self):
+        assert parse_duration("half a minute") == 30
+
+    def test_and_a_half_after_number(self):
+        assert parse_duration("one and a half hours") == 5400
+
+    def test_and_a_half_after_unit(self):
+        assert parse_duration("an hour and a half") == 5400
+
+    def test_no_number(self):
+        with pytest.raises(ValueError, match="No valid duration value found"):
+            parse_duration("please")
+
+    def test_fraction_without_unit(self):
+        with pytest.raises(ValueError, match="No valid duration value found"):
+            parse_duration("half")
+
+    def test_no_unit(self):
+        with pytest.raises(ValueError, match="Unknown duration unit"):
+            parse_duration("ten")
+
+
+class TestForecastCache:
+    """Tests for the per-download BOM forecast cache."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        import ftplib
+        import time
+
+        FakeFTP.DATA = _forecast_xml(
+            _area_xml("Sydney", (_day(), "Sunny.")),
+            _area_xml("Newcastle", (_day(), "Showers.")),
+        )
+        FakeFTP.connections = 0
+        monkeypatch.setattr(ftplib, "FTP", FakeFTP)
+        monkeypatch.setattr(weather_time, "_forecast_cache", {"ts": None, "area_by_name": {}})
+        monkeypatch.setattr(weather_time, "load_weather_config", lambda: {
+            "host": "ftp.example.com", "path": "/forecast.xml", "cache_ttl": 60,
+        })
+        now = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        return now
+
+    def test_single_download_within_ttl(self, clock):
+        assert "Sunny" in weather_time.get_weather_forecast("sydney")
+        clock[0] += 59
+        assert "Showers" in weather_time.get_weather_forecast("Newcastle")
+        assert "Sunny" in weather_time.get_weather_forecast("SYDNEY")
+        assert FakeFTP.connections == 1
+
+    def test_refetch_after_ttl(self, clock):
+        weather_time.get_weather_forecast("sydney")
+        clock[0] += 60
+        weather_time.get_weather_forecast("sydney")
+        assert FakeFTP.connections == 2
+
+    def test_unknown_location_uses_cache(self, clock):
+        weather_time.get_weather_forecast("sydney")
+        assert weather_time.get_weather_forecast("Nowhere") == ""
+        assert FakeFTP.connections == 1
+
+
+class TestForecastSummary:
+    """Tests for BOM <area> parsing and summaries."""
+
+    @staticmethod
+    def _summary(*periods):
+        from lxml import etree
+
+        area = etree.fromstring(_area_xml("Sydney", *periods))
+        return weather_time.summarize_today_tomorrow(weather_time.parse_area_periods(area), "Sydney")
+
+    def test_today_and_tomorrow(self):
+        summary = self._summary((_day(), "Sunny."), (_day(1), "Showers."), (_day(2), "Storms."))
+        assert summary == (
+            "Forecast for Sydney. "
+            "Today expect Sunny Maximum temperature 24 degrees Celcius. "
+            "Tomorrow expect Showers Maximum temperature 24 degrees Celcius"
+        )
+
+    def test_single_period(self):
+        assert self._summary((_day(), "Sunny.")) == (
+            "Forecast for Sydney. Today expect Sunny Maximum temperature 24 degrees Celcius"
+        )
+
+    def test_yesterday_dropped(self):
+        assert self._summary((_day(-1), "Rain."), (_day(), "Sunny.")) == (
+            "Forecast for Sydney. Today expect Sunny Maximum temperature 24 degrees Celcius"
+        )
+
+    def test_empty_precis(self):
+        assert "Today expect No forecast " in self._summary((_day(), None))
+
+    def test_area_missing_start_time_skipped(self, monkeypatch):
+        import ftplib
+
+        FakeFTP.DATA = _forecast_xml(
+            _area_xml("Broken", (None, "Sunny.")),
+            _area_xml("Sydney", (_day(), "Sunny.")),
+        )
+        monkeypatch.setattr(ftplib, "FTP", FakeFTP)
+
+        area_by_name = weather_time.fetch_area_periods({"host": "ftp.example.com", "path": "/forecast.xml"})
+
+        assert list(area_by_name) == ["sydney"]
@@ -13,10 +13,19 @@ import importlib
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C loader when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(f):
+    """Parse YAML from an open file with the fastest available safe loader."""
+    return yaml.load(f, Loader=_YAML_LOADER)
+
+
 # Load configuration to determine which tools to activate
 try:
     with open("./data/config.yml", "r") as f:
-        _config = yaml.safe_load(f) or {}
+        _config = load_yaml(f) or {}
 except FileNotFoundError:
     _config = {}
 
@@ -8,34 +8,61 @@ Note: This registers generic tool names like "turn_on" and "turn_off" which
 may conflict with other integrations (e.g., Philips Hue lighting).
 """
 
+import re
 import requests
-import yaml
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import Optional
 
+from . import load_yaml
 from .tool_registry import tool
 
 # Load configuration
 with open("./data/config.yml", "r") as f:
-    config = yaml.safe_load(f)
+    config = load_yaml(f)
 HA_CONFIG = config.get('home_assistant', {})
 
 # Home Assistant connection settings
 HA_URL = HA_CONFIG.get('url', 'http://localhost:8123')
 HA_TOKEN = HA_CONFIG.get('token', '')
 TIMEOUT = HA_CONFIG.get('timeout', 10)
-
-
-def _get_headers() -> dict:
-    """Return authorization headers for Home Assistant API."""
-    return {
+ENTITY_ALIASES = {k.casefold(): v for k, v in HA_CONFIG.get('entity_aliases', {}).items()}
+
+# Common color name mappings
+_COLOR_MAP: dict[str, tuple[int, int, int]] = {
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+    "orange": (255, 165, 0),
+    "purple": (128, 0, 128),
+    "pink": (255, 192, 203),
+    "white": (255, 255, 255),
+    "warm white": (255, 244, 229),
+    "cool white": (255, 255, 255),
+    "cyan": (0, 255, 255),
+    "magenta": (255, 0, 255),
+}
+# Brightness percentage (0-100) to Home Assistant's 0-255 range
+_PCT_TO_255 = tuple(round(i * 255 / 100) for i in range(101))
+_SPACE_TO_UNDERSCORE = str.maketrans(' ', '_')
+_RGB_RE = re.compile(r"^\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*$")
+
+
+# Shared session so repeated calls reuse the keep-alive connection to HA
+_HA_READY = bool(HA_TOKEN)
+_session = requests.Session()
+if _HA_READY:
+    _session.headers.update({
         "Authorization": f"Bearer {HA_TOKEN}",
         "Content-Type": "application/json",
-    }
+    })
+_session.mount(HA_URL, HTTPAdapter(pool_connections=4, pool_maxsize=10))
 
 
 def _call_service(domain: str, service: str, entity_id: str, data: Optional[dict] = None) -> str:
     """Call a Home Assistant service."""
-    if not HA_TOKEN:
+    if not _HA_READY:
         return "Error: Home Assistant token not configured. Add 'token' to home_assistant config."
 
     url = f"{HA_URL}/api/services/{domain}/{service}"
@@ -44,7 +71,7 @@ def _call_service(domain: str, service: str, entity_id: str, data: Optional[dict
         payload.update(data)
 
     try:
-        response = requests.post(url, headers=_get_headers(), json=payload, timeout=TIMEOUT)
+        response = _session.post(url, json=payload, timeout=TIMEOUT)
         response.raise_for_status()
         return f"Successfully called {domain}.{service} on {entity_id}"
     except requests.exceptions.ConnectionError:
@@ -59,43 +86,136 @@ def _call_service(domain: str, service: str, entity_id: str, data: Optional[dict
 
 def _get_state(entity_id: str) -> Optional[dict]:
     """Get the state of an entity from Home Assistant."""
-    if not HA_TOKEN:
+    if not _HA_READY:
         return None
 
     url = f"{HA_URL}/api/states/{entity_id}"
     try:
-        response = requests.get(url, headers=_get_headers(), timeout=TIMEOUT)
+        response = _session.get(url, timeout=TIMEOUT)
         response.raise_for_status()
         return response.json()
     except Exception:
         return None
 
 
-def _resolve_entity(name: str, domain: str = None) -> str:
-    """Resolve a friendly name or alias to an entity_id.
+# Whether HA accepts filter_entity_id on /api/states, learned on first use
+_bulk_states_supported: Optional[bool] = None
+
 
-    Checks the entity_aliases config mapping first, then assumes
-    the name is already a valid entity_id.
+def _get_states(entity_ids: list[str]) -> dict[str, dict]:
+    """Get the states of several entities from Home Assistant in one request.
+
+    Falls back to one request per entity if the instance does not support
+    filtering /api/states by entity_id.
     """
-    aliases = HA_CONFIG.get('entity_aliases', {})
+    global _bulk_states_supported
+    if not _HA_READY or not entity_ids:
+        return {}
+
+    if _bulk_states_supported is not False:
+        url = f"{HA_URL}/api/states"
+        params = [("filter_entity_id", entity_id) for entity_id in entity_ids]
+        try:
+            response = _session.get(url, params=params, timeout=TIMEOUT)
+            if response.status_code == 404:
+                _bulk_states_supported = False
+            else:
+                response.raise_for_status()
+                _bulk_states_supported = True
+                # Older instances ignore the filter and return every state
+                wanted = set(entity_ids)
+                return {s['entity_id']: s for s in response.json() if s.get('entity_id') in wanted}
+        except Exception:
+            return {}
+
+    states = {}
+    for entity_id in entity_ids:
+        state = _get_state(entity_id)
+        if state is not None:
+            states[entity_id] = state
+    return states
+
+
+def _get_services() -> dict[str, list[str]]:
+    """Get the available services from Home Assistant, keyed by domain."""
+    if not _HA_READY:
+        return {}
+
+    url = f"{HA_URL}/api/services"
+    try:
+        response = _session.get(url, timeout=TIMEOUT)
+        response.raise_for_status()
+        return {d['domain']: list(d.get('services', {})) for d in response.json()}
+    except Exception:
+        return {}
+
 
-    # Check if it's a configured alias
-    if name.lower() in aliases:
-        return aliases[name.lower()]
+def _get_bulk_status(entity_ids: list[str], include_services: bool = False) -> dict[str, dict]:
+    """Get states, and optionally domain services, for several entities at once.
 
-    # If it looks like an entity_id already, return as-is
+    The state and service lookups run concurrently over the shared session,
+    so the combined query costs a single round-trip.
+
+    Returns:
+        Mapping of entity_id to {"state": state or None, "services": [...]}
+    """
+    if include_services:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            states_future = executor.submit(_get_states, entity_ids)
+            services_future = executor.submit(_get_services)
+            states, services = states_future.result(), services_future.result()
+    else:
+        states, services = _get_states(entity_ids), {}
+
+    return {
+        entity_id: {
+            "state": states.get(entity_id),
+            "services": services.get(_domain_of(entity_id), []),
+        }
+        for entity_id in entity_ids
+    }
+
+
+def _resolve_entity(name: str, domain: str = None) -> str:
+    """Resolve a friendly name or alias to an entity_id.
+
+    Names that already look like an entity_id are returned as-is, otherwise
+    the entity_aliases config mapping is checked before building an
+    entity_id from the name and domain.
+    """
+    # Fast path: the name is already an entity_id
     if '.' in name:
         return name
 
+    # Check if it's a configured alias (keys are casefolded at import)
+    alias = ENTITY_ALIASES.get(name.casefold()) if ENTITY_ALIASES else None
+    if alias is not None:
+        return alias
+
     # Try to construct entity_id from name and domain
     if domain:
         # Convert "living room lights" -> "light.living_room_lights"
-        entity_name = name.lower().replace(' ', '_')
-        return f"{domain}.{entity_name}"
+        return f"{domain}.{name.lower().translate(_SPACE_TO_UNDERSCORE)}"
 
     return name
 
 
+def _domain_of(entity_id: str) -> str:
+    """Return the domain of an entity_id, or 'homeassistant' if it has none."""
+    head, sep, _ = entity_id.partition('.')
+    return head if sep else 'homeassistant'
+
+
+def _verb(domain_hint: Optional[str], service: str, entity: str) -> str:
+    """Resolve an entity and call a single service on it.
+
+    Without a domain hint the service domain is taken from the entity_id.
+    """
+    entity_id = _resolve_entity(entity, domain=domain_hint)
+    domain = domain_hint or _domain_of(entity_id)
+    return _call_service(domain, service, entity_id)
+
+
 @tool(
     name="turn_on",
     description="Turn on a device, light, switch, or other Home Assistant entity",
@@ -111,12 +231,12 @@ def turn_on(entity: str, brightness: Optional[int] = None) -> str:
     entity_id = _resolve_entity(entity, domain="light")
 
     # Determine the domain from entity_id
-    domain = entity_id.split('.')[0] if '.' in entity_id else 'homeassistant'
+    domain = _domain_of(entity_id)
 
     data = {}
     if brightness is not None and domain == 'light':
         # Convert percentage to 0-255 range
-        data['brightness'] = int((brightness / 100) * 255)
+        data['brightness'] = _PCT_TO_255[max(0, min(100, int(brightness)))]
 
     return _call_service(domain, "turn_on", entity_id, data if data else None)
 
@@ -132,10 +252,7 @@ def turn_off(entity: str) -> str:
     Args:
         entity: Entity name or ID (e.g., 'living room lights', 'light.living_room')
     """
-    entity_id = _resolve_entity(entity)
-    domain = entity_id.split('.')[0] if '.' in entity_id else 'homeassistant'
-
-    return _call_service(domain, "turn_off", entity_id)
+    return _verb(None, "turn_off", entity)
 
 
 @tool(
@@ -149,10 +266,7 @@ def toggle(entity: str) -> str:
     Args:
         entity: Entity name or ID (e.g., 'living room lights', 'light.living_room')
     """
-    entity_id = _resolve_entity(entity)
-    domain = entity_id.split('.')[0] if '.' in entity_id else 'homeassistant'
-
-    return _call_service(domain, "toggle", entity_id)
+    return _verb(None, "toggle", entity)
 
 
 @tool(
@@ -170,8 +284,7 @@ def set_ha_brightness(entity: str, brightness: int) -> str:
     entity_id = _resolve_entity(entity, domain="light")
 
     # Clamp brightness to valid range
-    brightness = max(0, min(100, brightness))
-    brightness_255 = int((brightness / 100) * 255)
+    brightness_255 = _PCT_TO_255[max(0, min(100, int(brightness)))]
 
     return _call_service("light", "turn_on", entity_id, {"brightness": brightness_255})
 
@@ -190,36 +303,19 @@ def set_color(entity: str, color: str) -> str:
     """
     entity_id = _resolve_entity(entity, domain="light")
 
-    # Common color name mappings
-    color_map = {
-        "red": [255, 0, 0],
-        "green": [0, 255, 0],
-        "blue": [0, 0, 255],
-        "yellow": [255, 255, 0],
-        "orange": [255, 165, 0],
-        "purple": [128, 0, 128],
-        "pink": [255, 192, 203],
-        "white": [255, 255, 255],
-        "warm white": [255, 244, 229],
-        "cool white": [255, 255, 255],
-        "cyan": [0, 255, 255],
-        "magenta": [255, 0, 255],
-    }
-
     color_lower = color.lower().strip()
 
-    if color_lower in color_map:
-        rgb = color_map[color_lower]
-    elif ',' in color:
+    rgb = _COLOR_MAP.get(color_lower)
+    if rgb is None:
+        if ',' not in color:
+            return f"Error: Unknown color '{color}'. Use a color name or RGB format."
         # Parse RGB string like "255,128,0"
-        try:
-            rgb = [int(c.strip()) for c in color.split(',')]
-            if len(rgb) != 3:
+        match = _RGB_RE.match(color)
+        if match is None:
+            if color.count(',') != 2:
                 return "Error: RGB color must have 3 values (e.g., '255,128,0')"
-        except ValueError:
             return f"Error: Invalid RGB color format '{color}'"
-    else:
-        return f"Error: Unknown color '{color}'. Use a color name or RGB format."
+        rgb = [int(c) for c in match.groups()]
 
     return _call_service("light", "turn_on", entity_id, {"rgb_color": rgb})
 
@@ -229,18 +325,36 @@ def set_color(entity: str, color: str) -> str:
     description="Get the current state of a Home Assistant entity",
     aliases=["ha_state", "check_state", "is_on"]
 )
-def get_entity_state(entity: str) -> str:
-    """Get the current state of a Home Assistant entity.
+def get_entity_state(entity: list) -> str:
+    """Get the current state of one or more Home Assistant entities.
 
     Args:
-        entity: Entity name or ID
+        entity: Entity name or ID, or a list of them (or a comma separated string)
     """
-    entity_id = _resolve_entity(entity)
-    state = _get_state(entity_id)
-
-    if state is None:
-        return f"Error: Could not get state for {entity_id}"
-
+    if isinstance(entity, str):
+        entity = [e.strip() for e in entity.split(',') if e.strip()]
+    if not entity:
+        return "Error: No entity specified"
+
+    if len(entity) == 1:
+        entity_id = _resolve_entity(entity[0])
+        state = _get_state(entity_id)
+        if state is None:
+            return f"Error: Could not get state for {entity_id}"
+        return _describe_state(entity_id, state)
+
+    # Repeated entities are only reported once
+    entity_ids = list(dict.fromkeys(_resolve_entity(e) for e in entity))
+    status = _get_bulk_status(entity_ids)
+    return "; ".join(
+        _describe_state(entity_id, info["state"]) if info["state"] is not None
+        else f"Error: Could not get state for {entity_id}"
+        for entity_id, info in status.items()
+    )
+
+
+def _describe_state(entity_id: str, state: dict) -> str:
+    """Format an entity state and its relevant attributes for speech."""
     entity_state = state.get('state', 'unknown')
     friendly_name = state.get('attributes', {}).get('friendly_name', entity_id)
 
@@ -259,6 +373,39 @@ def get_entity_state(entity: str) -> str:
     return ", ".join(details)
 
 
+@tool(
+    name="ha_get_bulk_status",
+    description="Get the state and available services of several Home Assistant entities at once",
+    aliases=["ha_bulk_status", "ha_status"]
+)
+def ha_get_bulk_status(entities: list) -> str:
+    """Get the state and available services of several entities in one query.
+
+    Args:
+        entities: List of entity names or IDs (or a comma separated string)
+    """
+    if isinstance(entities, str):
+        entities = [e.strip() for e in entities.split(',') if e.strip()]
+    if not entities:
+        return "Error: No entity specified"
+
+    # Repeated entities are only reported once
+    entity_ids = list(dict.fromkeys(_resolve_entity(e) for e in entities))
+    status = _get_bulk_status(entity_ids, include_services=True)
+
+    lines = []
+    for entity_id, info in status.items():
+        if info["state"] is None:
+            lines.append(f"Error: Could not get state for {entity_id}")
+            continue
+        line = _describe_state(entity_id, info["state"])
+        if info["services"]:
+            line += f" (services: {', '.join(info['services'])})"
+        lines.append(line)
+
+    return "; ".join(lines)
+
+
 @tool(
     name="ha_service",
     description="Call any Home Assistant service with custom data",
@@ -320,8 +467,7 @@ def lock(entity: str) -> str:
     Args:
         entity: Lock entity name or ID
     """
-    entity_id = _resolve_entity(entity, domain="lock")
-    return _call_service("lock", "lock", entity_id)
+    return _verb("lock", "lock", entity)
 
 
 @tool(
@@ -335,8 +481,7 @@ def unlock(entity: str) -> str:
     Args:
         entity: Lock entity name or ID
     """
-    entity_id = _resolve_entity(entity, domain="lock")
-    return _call_service("lock", "unlock", entity_id)
+    return _verb("lock", "unlock", entity)
 
 
 @tool(
@@ -350,8 +495,7 @@ def open_cover(entity: str) -> str:
     Args:
         entity: Cover entity name or ID
     """
-    entity_id = _resolve_entity(entity, domain="cover")
-    return _call_service("cover", "open_cover", entity_id)
+    return _verb("cover", "open_cover", entity)
 
 
 @tool(
@@ -365,8 +509,7 @@ def close_cover(entity: str) -> str:
     Args:
         entity: Cover entity name or ID
     """
-    entity_id = _resolve_entity(entity, domain="cover")
-    return _call_service("cover", "close_cover", entity_id)
+    return _verb("cover", "close_cover", entity)
 
 
 @tool(
@@ -380,8 +523,7 @@ def run_script(script_name: str) -> str:
     Args:
         script_name: Script entity ID or name (e.g., 'script.bedtime' or 'bedtime')
     """
-    entity_id = _resolve_entity(script_name, domain="script")
-    return _call_service("script", "turn_on", entity_id)
+    return _verb("script", "turn_on", script_name)
 
 
 @tool(
@@ -395,5 +537,4 @@ def activate_scene(scene_name: str) -> str:
     Args:
         scene_name: Scene entity ID or name (e.g., 'scene.movie_time' or 'movie time')
     """
-    entity_id = _resolve_entity(scene_name, domain="scene")
-    return _call_service("scene", "turn_on", entity_id)
+    return _verb("scene", "turn_on", scene_name)
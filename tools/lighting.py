@@ -1,18 +1,60 @@
 """
 Philips Hue lighting control tool
 """
-import yaml
+from . import load_yaml
 
 with open("./data/config.yml", "r") as f:
-    config = yaml.safe_load(f)
+    config = load_yaml(f)
 
-from phue import Bridge
+import time
+
+from phue import Bridge, PhueRequestTimeout
 
 from .tool_registry import tool, tool_registry
 
 b = Bridge(config['philips']['hue_hub_ip'], config_file_path="./data/.python_hue")
 
 
+def _hue_call(fn, *args, **kwargs):
+    """Run a bridge call, reconnecting and retrying once on a dropped connection."""
+    try:
+        return fn(*args, **kwargs)
+    except (PhueRequestTimeout, ConnectionError):
+        b.connect()
+        return fn(*args, **kwargs)
+
+
+# Brightness percentage (0-100) to the Hue 0-254 range
+_PCT_TO_254 = tuple(round(i * 254 / 100) for i in range(101))
+
+# Bridge topology rarely changes, so cache light and group names between calls
+_light_cache = {"t": 0, "lights": None, "group_name_to_id": None}
+
+
+def _get_topology(ttl=60):
+    """Return (lights by name, group name to id), refreshing from the bridge after ttl seconds.
+
+    Names are casefolded so lookups ignore case, e.g. "TV Lamp" vs "Tv Lamp".
+
+    Bridge calls are made with the cached ids, since phue would otherwise
+    fetch the full light or group list to resolve a name on every call.
+    """
+    if _light_cache["lights"] is None or time.time() - _light_cache["t"] > ttl:
+        _light_cache["lights"] = {
+            name.casefold(): light for name, light in _hue_call(b.get_light_objects, 'name').items()
+        }
+        _light_cache["group_name_to_id"] = {
+            g['name'].casefold(): int(gid) for gid, g in _hue_call(b.get_group).items()
+        }
+        _light_cache["t"] = time.time()
+    return _light_cache["lights"], _light_cache["group_name_to_id"]
+
+
+def _invalidate_topology():
+    """Force the next lookup to refresh the topology from the bridge."""
+    _light_cache["lights"] = None
+
+
 @tool(
     name="turn_on_lights",
     description="Turn on lights in a specific location",
@@ -28,20 +70,22 @@ def turn_on_lights(location: str = "Downlights Office") -> str:
     Returns:
         Status message about the action
     """
-    location = location.title()  # First Letters Capitalized
-    if location in b.get_light_objects('name').keys():
-        b.set_light(location, 'on', True)
-        return f"{location} lights on"
-    
-    groups = b.get_group()
-    group_names = []
-    for i in groups:
-        group_names.append(groups[i]['name'])
-    if location in group_names:
-        b.set_group(location, 'on', True)
-        return f"{location} on"
-    else:
-        return f"No lights or rooms with name {location}"
+    try:
+        location = location.title()  # First Letters Capitalized
+        key = location.casefold()
+        lights, group_name_to_id = _get_topology()
+        if key in lights:
+            _hue_call(b.set_light, lights[key].light_id, 'on', True)
+            return f"{location} lights on"
+
+        if key in group_name_to_id:
+            _hue_call(b.set_group, group_name_to_id[key], 'on', True)
+            return f"{location} on"
+        else:
+            return f"No lights or rooms with name {location}"
+    except Exception:
+        _invalidate_topology()
+        return f"Unable to connect to lights for {location}"
 
 
 @tool(
@@ -61,21 +105,20 @@ def turn_off_lights(location: str = "Downlights Office") -> str:
     """
     try:
         location = location.title()  # First Letters Capitalized
-        if location in b.get_light_objects('name').keys():
-            b.set_light(location, 'on', False)
+        key = location.casefold()
+        lights, group_name_to_id = _get_topology()
+        if key in lights:
+            _hue_call(b.set_light, lights[key].light_id, 'on', False)
             return f"{location} lights off"
-        
-        groups = b.get_group()
-        group_names = []
-        for i in groups:
-            group_names.append(groups[i]['name'])
-        if location in group_names:
-            b.set_group(location, 'on', False)
+
+        if key in group_name_to_id:
+            _hue_call(b.set_group, group_name_to_id[key], 'on', False)
             return f"{location} off"
         else:
             return f"No lights or rooms with name {location}"
-    except Exception as e:
-            return f"Unable to connect to lights for {location}"
+    except Exception:
+        _invalidate_topology()
+        return f"Unable to connect to lights for {location}"
 
 
 @tool(
@@ -96,25 +139,23 @@ def set_brightness(percent: int = 100, location: str = "Downlights Office") -> s
     """   
     try:
         location = location.title()  # First Letters Capitalized
-        if location in b.get_light_objects('name').keys():
-            b.set_light(location, 'on', True)
-            level = int((int(percent) / 100) * 254)
-            b.set_light(location, 'bri', level)
+        key = location.casefold()
+        level = _PCT_TO_254[max(0, min(100, int(percent)))]
+        lights, group_name_to_id = _get_topology()
+        if key in lights:
+            _hue_call(b.set_light, lights[key].light_id, 'on', True)
+            _hue_call(b.set_light, lights[key].light_id, 'bri', level)
             return f"{location} lights set to {percent} percent."
-        
-        groups = b.get_group()
-        group_names = []
-        for i in groups:
-            group_names.append(groups[i]['name'])
-        if location in group_names:
-            b.set_group(location, 'on', True)
-            level = int((int(percent) / 100) * 254)
-            b.set_group(location, 'bri', level)
+
+        if key in group_name_to_id:
+            _hue_call(b.set_group, group_name_to_id[key], 'on', True)
+            _hue_call(b.set_group, group_name_to_id[key], 'bri', level)
             return f"{location} set to {percent} percent."
         else:
             return f"No lights or rooms with name {location}"
-    except Exception as e:
-            return f"Unable to connect to lights for {location}"
+    except Exception:
+        _invalidate_topology()
+        return f"Unable to connect to lights for {location}"
 
 
 if __name__ == "__main__":
@@ -1,24 +1,55 @@
 """
 Web Search using SearXNG
 """
-import yaml
-
-with open("./data/config.yml", "r") as f:
-    config = yaml.safe_load(f)
-
+import atexit
+import functools
 import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 # import utils.system_prompts
 from datetime import datetime
-from bs4 import BeautifulSoup
 
+from . import load_yaml
 from .tool_registry import tool, tool_registry
 
 import logging
 
 logger = logging.getLogger(__name__)
 
-SEARXNG_URL = config['search']['searxng_url']
+_WS_RE = re.compile(r"\s+")
+_STRIP_TAGS = ("script", "style", "noscript", "footer", "header", "nav", "aside", "form")
+_STRIP_CSS = ",".join(_STRIP_TAGS)
+
+NUM_RESULTS = 3
+MAX_HTML_BYTES = 256 * 1024
+
+# The formatted date only changes once a day
+_today_cache = {"day": None, "s": ""}
+
+# Shared session so repeat hits to the same news sites reuse connections
+_session = requests.Session()
+for _prefix in ("http://", "https://"):
+    _session.mount(_prefix, HTTPAdapter(pool_maxsize=NUM_RESULTS))
+
+
+@functools.lru_cache(maxsize=None)
+def _cfg():
+    """Load ./data/config.yml on first use rather than at import."""
+    with open("./data/config.yml", "r") as f:
+        return load_yaml(f)
+
+
+@functools.lru_cache(maxsize=None)
+def _searx_client():
+    """Create the persistent HTTP/2 client for SearXNG queries on first use."""
+    # Deferred so importing the tool doesn't pay for httpx and httpcore
+    import httpx
+
+    client = httpx.Client(http2=True, timeout=10.0)
+    atexit.register(client.close)
+    return client
+
 
 def searxng_search(query, num_results=3):
     """
@@ -29,25 +60,29 @@ def searxng_search(query, num_results=3):
         'format': 'json',
         'categories': 'general'
     }
-    resp = requests.get(SEARXNG_URL, params=payload)
+    resp = _searx_client().get(_cfg()['search']['searxng_url'], params=payload)
     resp.raise_for_status()
     results = resp.json().get('results', [])
     top_urls = [r['url'] for r in results[:num_results]]
     return top_urls
 
 def extract_main_text(html):
+    # Deferred so deployments that never search skip the parser import
+    from selectolax.lexbor import LexborHTMLParser
+
     # Extract visible text from main body
-    soup = BeautifulSoup(html, "html.parser")
-    for bad in soup(["script", "style", "noscript", "footer", "header", "nav", "aside", "form"]):
+    tree = LexborHTMLParser(html)
+    for bad in tree.css(_STRIP_CSS):
         bad.decompose()
     # Combine text from all paragraphs
-    p_texts = [p.get_text(" ", strip=True) for p in soup.find_all("p") if len(p.get_text(strip=True)) > 40]
+    p_texts = [p.text(separator=" ", strip=True) for p in tree.css("p") if len(p.text(strip=True)) > 40]
     if not p_texts:
-        text = soup.get_text(separator=" ", strip=True)
+        root = tree.body or tree.root
+        text = root.text(separator=" ", strip=True) if root else ""
     else:
         text = "\n".join(p_texts)
     # Clean whitespace
-    text = re.sub(r"\s+", " ", text)
+    text = _WS_RE.sub(" ", text)
     return text
 
 def fetch_website_summary(url, max_length=3000):
@@ -56,9 +91,11 @@ def fetch_website_summary(url, max_length=3000):
     """
     text = ""
     try:
-        resp = requests.get(url, timeout=10)
-        resp.raise_for_status()
-        html = resp.text
+        # Stream and cap the body, the snippet never needs the whole page
+        with _session.get(url, timeout=10, stream=True) as resp:
+            resp.raise_for_status()
+            raw = resp.raw.read(MAX_HTML_BYTES, decode_content=True)
+            html = raw.decode(resp.encoding or "utf-8", errors="replace")
 
         # Extract main readable content
         text = extract_main_text(html)
@@ -70,6 +107,15 @@ def fetch_website_summary(url, max_length=3000):
     except Exception as e:
         return text
 
+def _today():
+    """Return today's date as spoken text, e.g. "October 14, 2026"."""
+    now = datetime.now()
+    day = now.toordinal()
+    if day != _today_cache["day"]:
+        _today_cache["s"] = now.strftime("%B %d, %Y")
+        _today_cache["day"] = day
+    return _today_cache["s"]
+
 @tool(
     name="external_information",
     description="Retrieve news and current event information through web search",
@@ -85,22 +131,19 @@ def external_information(query: str = "get me the latest news stories") -> str:
     Returns:
         LLM Response on retrieved information
     """
-    website_snippets = []
+    lines = [f"Today is {_today()}.", ""]
     try:
-        top_urls = searxng_search(query, num_results=3)
-        for url in top_urls:
-            snippet = fetch_website_summary(url)
-            website_snippets.append(f"\n\nFrom {url}: {snippet}...")
+        top_urls = searxng_search(query, num_results=NUM_RESULTS)
+        if top_urls:
+            # Fetch pages concurrently, map() keeps results in URL order
+            with ThreadPoolExecutor(max_workers=len(top_urls)) as executor:
+                snippets = executor.map(fetch_website_summary, top_urls)
+                lines.append("A web search has retrieved the following information:")
+                lines.extend(f"\n\nFrom {url}: {snippet}..." for url, snippet in zip(top_urls, snippets, strict=True))
+                lines.append("")
     except Exception as e:
         logger.error(f"Unable to search web: {e}")
-    
-    today = datetime.now().strftime("%B %d, %Y")
 
-    lines = [f"Today is {today}.", ""]
-    if website_snippets:
-        lines.append("A web search has retrieved the following information:")
-        lines.extend(website_snippets)
-        lines.append("")
     lines.append("User question:")
     lines.append(query)
 
@@ -1,66 +1,120 @@
 """
 Weather and time information tool using the centralized tool registry.
 """
-import yaml
-
-try:
-    with open("./data/config.yml", "r") as f:
-        config = yaml.safe_load(f) or {}
-except FileNotFoundError:
-    config = {}
-
 from datetime import datetime
+import functools
+import itertools
 import re
-from ftplib import FTP
-import xmltodict
-import io
 from typing import Optional, Dict
-from word2number import w2n
 import threading
 import json
 import os
 import time
 import sys
 
+from . import load_yaml
 from .tool_registry import tool, tool_registry
 
 # Get the absolute path to the parent directory for importing of audio manager
 parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 sys.path.append(parent_dir)
 
-from audio.beep_manager import BeepManager
-# Dictionary to store active timers
+# Dictionary to store active timers, guarded by _timers_lock since timer
+# callbacks remove entries from their own threads
 active_timers: Dict[str, threading.Timer] = {}
+_timers_lock = threading.Lock()
+_timer_ids = itertools.count(1)
 
-beep_manager = BeepManager()
+# Heavy dependencies (lxml, ftplib, sound playback) are imported on first
+# use so that loading the tool registry stays fast
+_bm = None
 
 
-def summarize_today_tomorrow(forecast_data, location):
-    """Summarize weather forecast for today and tomorrow."""
-    days = forecast_data['forecast-period'][:2]  # Only first two days
+@functools.lru_cache(maxsize=None)
+def _get_config() -> dict:
+    """Load ./data/config.yml on first use."""
+    try:
+        with open("./data/config.yml", "r") as f:
+            return load_yaml(f) or {}
+    except FileNotFoundError:
+        return {}
+
+
+def _beep():
+    """Return the shared BeepManager, creating it on first use."""
+    global _bm
+    if _bm is None:
+        from audio.beep_manager import BeepManager
+        _bm = BeepManager()
+    return _bm
+
+
+@functools.lru_cache(maxsize=None)
+def _alarm_buffer():
+    """Return (samples, samplerate) for the alarm played three times, one second apart."""
+    import numpy as np
+
+    data, samplerate = _beep().load_wav("alarm.wav")
+    # Pad each beep out to a full second, matching the old play-then-sleep(1) rhythm
+    gap = np.zeros((max(0, samplerate - len(data)),) + data.shape[1:], dtype=data.dtype)
+    return np.concatenate([data, gap, data, gap, data]), samplerate
+
+
+# Spoken time formatting for get_current_time
+_TIME_FMT = "%A %B %d %Y at %I %M %p"  # No punctuation
+_ZERO_RE = re.compile(r'\b0(\d)\b')
+_AMPM_RE = re.compile(r'([AP])M\b')
+
+# Vocabulary for spoken timer durations
+_NUM_WORDS = {
+    "zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+    "eleven": 11, "twelve": 12, "thirteen": 13, "fourteen": 14, "fifteen": 15,
+    "sixteen": 16, "seventeen": 17, "eighteen": 18, "nineteen": 19,
+    "twenty": 20, "thirty": 30, "forty": 40, "fifty": 50,
+    "sixty": 60, "seventy": 70, "eighty": 80, "ninety": 90,
+}
+_UNITS = {
+    "hour": 3600, "hours": 3600, "hr": 3600, "hrs": 3600,
+    "minute": 60, "minutes": 60, "min": 60, "mins": 60,
+    "second": 1, "seconds": 1, "sec": 1, "secs": 1,
+}
+_FRACTIONS = {"half": 0.5, "quarter": 0.25, "quarters": 0.25}
+_DURATION_TOKEN_RE = re.compile(r'\d+(?:\.\d+)?|[a-z]+')
+
+# Latest forecast download: when it was fetched and (name, periods) by lowercase area name.
+# Summaries are built on lookup so "Today"/"Tomorrow" stay right across midnight
+_forecast_cache = {"ts": None, "area_by_name": {}}
+
+
+def parse_area_periods(area):
+    """Pull (date, elements, texts) for today and tomorrow out of an <area> element."""
+    periods = []
+    for day in area.findall('forecast-period')[:2]:  # Only first two days
+        date_str = day.get('start-time-local')[:10]
+        periods.append((
+            datetime.strptime(date_str, "%Y-%m-%d").date(),
+            {e.get('type'): e.text for e in day.iterfind('element')},
+            {t.get('type'): t.text for t in day.iterfind('text')},
+        ))
+    return periods
+
+
+def summarize_today_tomorrow(periods, location):
+    """Summarize weather forecast for today and tomorrow from parsed forecast periods."""
     summary_lines = [f"Forecast for {location}"]
+    today = datetime.today().date()
 
-    for day in days:
-        date_str = day['@start-time-local'][:10]
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-        label = "Today" if date_obj.date() == datetime.today().date() else "Tomorrow"
-
-        # Normalize to list
-        elements = day.get('element', [])
-        if isinstance(elements, dict):
-            elements = [elements]
-        texts = day.get('text', [])
-        if isinstance(texts, dict):
-            texts = [texts]
-
-        element_dict = {e['@type']: e['#text'] for e in elements}
-        text_dict = {t['@type']: t['#text'] for t in texts}
+    for date, element_dict, text_dict in periods:
+        if date < today:
+            continue  # Cached from before midnight
+        label = "Today" if date == today else "Tomorrow"
 
         min_temp = element_dict.get('air_temperature_minimum')
         max_temp = element_dict.get('air_temperature_maximum')
         precip_range = element_dict.get('precipitation_range')
         chance_of_rain = text_dict.get('probability_of_precipitation')
-        precis = text_dict.get('precis', 'No forecast.')
+        precis = text_dict.get('precis') or 'No forecast.'
 
         parts = [f"{label} expect {precis.replace('.', '')}"]
         if min_temp and max_temp:
@@ -78,12 +132,43 @@ def summarize_today_tomorrow(forecast_data, location):
 
 
 def load_weather_config():
-    return config.get('bom', {
+    return _get_config().get('bom', {
         "host": "ftp.bom.gov.au",
         "path": "/anon/gen/fwo/IDN11060.xml"
     })
 
 
+def fetch_area_periods(ftp_config) -> Dict[str, tuple]:
+    """Download the BOM forecast and parse every area into (name, periods), keyed by lowercase name."""
+    from ftplib import FTP
+    from lxml import etree
+
+    # Parse <area> elements as the file arrives, discarding each once parsed
+    parser = etree.XMLPullParser(events=('end',), tag='area', resolve_entities=False, no_network=True)
+    area_by_name = {}
+
+    def feed(block: bytes):
+        parser.feed(block)
+        for _, area in parser.read_events():
+            name = area.get('description', '')
+            try:
+                area_by_name[name.lower()] = (name, parse_area_periods(area))
+            except (TypeError, ValueError):
+                pass  # A malformed area shouldn't cost every other location its forecast
+            area.clear()
+
+    # Connect to FTP and stream the file into the parser
+    ftp = FTP(ftp_config['host'])
+    try:
+        ftp.login()  # Anonymous login
+        ftp.retrbinary(f"RETR {ftp_config['path']}", feed)
+        ftp.quit()
+    finally:
+        ftp.close()  # Drops the socket even if the download failed part way
+
+    return area_by_name
+
+
 @tool(
     name="get_weather_forecast",
     description="Get weather forecast for a location",
@@ -104,25 +189,18 @@ def get_weather_forecast(location: str = None) -> str:
     if location is None:
         location = ftp_config.get('default', 'Sydney')
     
-    # Connect to FTP and retrieve file into memory
-    ftp = FTP(ftp_config['host'])
-    ftp.login()  # Anonymous login
-
-    xml_data = io.BytesIO()
-    ftp.retrbinary(f"RETR {ftp_config['path']}", xml_data.write)
-    ftp.quit()
-
-    xml_data.seek(0)
-    data = xmltodict.parse(xml_data.read())
-
-    # Find forecast
-    areas = data['product']['forecast']['area']
-    for area in areas:
-        if area['@description'].lower() == location.lower():
-            return summarize_today_tomorrow(area, location)
+    # Refresh every area in one download once the cached copy expires
+    ttl = ftp_config.get('cache_ttl', 1800)
+    if _forecast_cache["ts"] is None or time.monotonic() - _forecast_cache["ts"] >= ttl:
+        _forecast_cache["area_by_name"] = fetch_area_periods(ftp_config)
+        _forecast_cache["ts"] = time.monotonic()
 
     # Return nothing if no forecast found
-    return ""
+    area = _forecast_cache["area_by_name"].get(location.lower())
+    if area is None:
+        return ""
+    name, periods = area
+    return summarize_today_tomorrow(periods, name)
 
 
 @tool(
@@ -141,16 +219,89 @@ def get_current_time(location: Optional[str] = None) -> str:
         Formatted current date and time
     """
     # TODO: get location time
-    # Format into natural spoken English
-    text = datetime.now().strftime("%A %B %d %Y at %I %M %p")  # No punctuation
+    # Format into natural spoken English, removing the leading zero in the
+    # hour (e.g., "08" → "8") and spacing AM/PM out for TTS
+    return _AMPM_RE.sub(r'\1 M', _ZERO_RE.sub(r'\1', datetime.now().strftime(_TIME_FMT)))
 
-    # Optional: Remove leading zero in hour (e.g., "08" → "8")
-    text = re.sub(r'\b0(\d)\b', r'\1', text)
-    
-    # Convert AM/PM to lowercase if preferred for TTS
-    text = text.replace("AM", "A M").replace("PM", "P M")
 
-    return text
+def parse_duration(duration_str: str) -> int:
+    """
+    Convert a spoken duration into seconds.
+
+    Each number is applied to the unit that follows it, so "one hour twenty five
+    minutes" is 3600 + 25 * 60. Digits ("1.5 hours"), "a"/"an" before a unit and
+    the fractions "half"/"quarter" ("half an hour", "an hour and a half") are
+    understood too.
+
+    Args:
+        duration_str: Duration string like "ten minutes" or "1.5 hours"
+
+    Returns:
+        Duration in whole seconds
+
+    Raises:
+        ValueError: If no number or no unit is found
+    """
+    tokens = _DURATION_TOKEN_RE.findall(duration_str.lower())
+    seconds = 0.0
+    value = None  # Number waiting for its unit
+    from_words = False  # Number words add up ("twenty five"), digits don't
+    last_unit = None
+    found_number = found_unit = False
+
+    for i, word in enumerate(tokens):
+        if word in _NUM_WORDS:
+            value = (value if from_words else 0) + _NUM_WORDS[word]
+            from_words = True
+        elif word[0].isdigit():
+            value = float(word)
+            from_words = False
+        elif word == "hundred":
+            value = (value or 1) * 100
+            from_words = True
+        elif word in ("a", "an"):
+            # Only "an hour", not the "a" in "half a minute" or "one and a half"
+            if value is not None or i + 1 >= len(tokens) or tokens[i + 1] not in _UNITS:
+                continue
+            value = 1
+        elif word in _FRACTIONS:
+            fraction = _FRACTIONS[word]
+            if value is not None:
+                # "one and a half" adds, "three quarters" multiplies
+                value = value + fraction if tokens[i - 2:i] == ["and", "a"] else value * fraction
+            elif any(t in _UNITS for t in tokens[i + 1:]):
+                value = fraction  # "half an hour", "quarter of an hour"
+            elif last_unit is not None:
+                seconds += fraction * last_unit  # "an hour and a half"
+            else:
+                continue
+            from_words = False
+        elif word in _UNITS and value is not None:
+            last_unit = _UNITS[word]
+            seconds += value * last_unit
+            value, from_words = None, False
+            found_unit = True
+        else:
+            continue
+        found_number = True
+
+    if not found_number:
+        raise ValueError("No valid duration value found")
+    if not found_unit:
+        raise ValueError("Unknown duration unit")
+
+    return round(seconds)
+
+
+def _spoken_duration(seconds: int) -> str:
+    """Format a whole number of seconds like "1 hour 30 minutes"."""
+    h, rem = divmod(seconds, 3600)
+    m, s = divmod(rem, 60)
+    parts = [
+        f"{n} {unit if n == 1 else unit + 's'}"
+        for n, unit in ((h, "hour"), (m, "minute"), (s, "second")) if n
+    ]
+    return " ".join(parts) or "0 seconds"
 
 
 @tool(
@@ -168,69 +319,26 @@ def start_countdown(duration: str) -> str:
     Returns:
         Confirmation message
     """
-    def parse_duration(duration_str: str) -> int:
-        duration_str = duration_str.lower()
-        
-        # Extract number words and convert to digits
-        number_str = ""
-        unit = ""
-        for word in duration_str.split():
-            try:
-                val = w2n.word_to_num(word)
-                number_str = str(val)
-            except ValueError:
-                unit += word + " "
-        
-        if not number_str:
-            # Try direct digit extraction
-            numbers = re.findall(r'\d+', duration_str)
-            if not numbers:
-                raise ValueError("No valid duration value found")
-            number_str = numbers[0]
-            
-        value = int(number_str)
-        
-        if "hour" in unit:
-            seconds = value * 3600
-        elif "minute" in unit:
-            seconds = value * 60
-        elif "second" in unit:
-            seconds = value
-        else:
-            raise ValueError("Unknown duration unit")
-            
-        return seconds
-
     def on_timer_complete(timer_id: str):
-        if timer_id in active_timers:
-            del active_timers[timer_id]
+        with _timers_lock:
+            active_timers.pop(timer_id, None)
         # Play alarm sound three times with pause when timer completes
-        for i in [1,1,1]:
-            beep_manager.play_beep(filename="alarm.wav")
-            time.sleep(i)
+        _beep().play_buffer(*_alarm_buffer())
 
     try:
         seconds = parse_duration(duration)
-        timer_id = f"timer_{len(active_timers) + 1}"
+        timer_id = f"timer_{next(_timer_ids)}"
         
-        # Create and start timer
+        # Create timer and store its reference before starting, so a short
+        # timer can't complete before it is registered
         timer = threading.Timer(seconds, on_timer_complete, args=[timer_id])
         timer.daemon = True
-        timer.start_time = time.time()  # Add this line to track start time
+        timer.start_time = time.time()  # Track start time for status queries
+        with _timers_lock:
+            active_timers[timer_id] = timer
         timer.start()
         
-        # Store timer reference
-        active_timers[timer_id] = timer
-        
-        # Format response message
-        if seconds >= 3600:
-            hours = seconds // 3600
-            return f"Timer started for {hours} {'hour' if hours == 1 else 'hours'}"
-        elif seconds >= 60:
-            minutes = seconds // 60
-            return f"Timer started for {minutes} {'minute' if minutes == 1 else 'minutes'}"
-        else:
-            return f"Timer started for {seconds} {'second' if seconds == 1 else 'seconds'}"
+        return f"Timer started for {_spoken_duration(seconds)}"
             
     except ValueError as e:
         return f"Error: {str(e)}"
@@ -251,13 +359,25 @@ def cancel_timer(timer_id: str) -> str:
     Returns:
         Confirmation message
     """
-    if timer_id in active_timers:
-        timer = active_timers[timer_id]
+    with _timers_lock:
+        timer = active_timers.pop(timer_id, None)
+    if timer is not None:
         timer.cancel()
-        del active_timers[timer_id]
         return f"Timer {timer_id} cancelled"
     return f"Timer {timer_id} not found"
 
+
+def _format_time_remaining(seconds: float) -> str:
+    """Format remaining time into hours, minutes and seconds."""
+    h, rem = divmod(int(seconds), 3600)
+    m, s = divmod(rem, 60)
+    if h:
+        return f"{h} hours {m} minutes {s} seconds"
+    if m:
+        return f"{m} minutes {s} seconds"
+    return f"{s} seconds"
+
+
 @tool(
     name="get_timer_status",
     description="Get the status of a timer or all timers including time remaining",
@@ -273,40 +393,29 @@ def get_timer_status(timer_id: Optional[str] = None) -> str:
     Returns:
         Timer status information
     """
-    def format_time_remaining(seconds: float) -> str:
-        """Format remaining time into hours, minutes and seconds."""
-        remaining = int(seconds)
-        if remaining >= 3600:
-            hours = remaining // 3600
-            minutes = (remaining % 3600) // 60
-            seconds = remaining % 60
-            return f"{hours} hours {minutes} minutes {seconds} seconds"
-        elif remaining >= 60:
-            minutes = remaining // 60
-            seconds = remaining % 60
-            return f"{minutes} minutes {seconds} seconds"
-        else:
-            return f"{remaining} seconds"
+    # Work from a snapshot so completing timers can't change it mid-iteration
+    with _timers_lock:
+        snapshot = list(active_timers.items())
 
-    if not active_timers:
+    if not snapshot:
         return "No active timers"
-        
+
+    now = time.time()
     if timer_id:
-        if timer_id not in active_timers:
+        timer = dict(snapshot).get(timer_id)
+        if timer is None:
             return f"Timer {timer_id} not found"
-            
-        timer = active_timers[timer_id]
-        remaining = max(0, timer.interval - (time.time() - timer.start_time))
-        time_str = format_time_remaining(remaining)
+
+        remaining = max(0, timer.interval - (now - timer.start_time))
+        time_str = _format_time_remaining(remaining)
         return f"Timer {timer_id} has {time_str} remaining"
     
     # Show status of all timers
-    statuses = []
-    for tid, timer in active_timers.items():
-        remaining = max(0, timer.interval - (time.time() - timer.start_time))
-        time_str = format_time_remaining(remaining)
-        statuses.append(f"{tid}: {time_str}")
-            
+    statuses = [
+        f"{tid}: {_format_time_remaining(max(0, timer.interval - (now - timer.start_time)))}"
+        for tid, timer in snapshot
+    ]
+
     return "Timer status:\n" + "\n".join(statuses)
 
 